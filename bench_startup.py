@@ -0,0 +1,35 @@
+"""Measure time from launch to the first rendered frame (the intro).
+
+Run it in a real terminal:
+
+    $ python bench_startup.py
+"""
+
+import time
+
+START = time.perf_counter()
+
+import curses
+
+import main
+
+IMPORTED = time.perf_counter()
+
+STARTUP_BUDGET = 0.05
+
+
+def first_frame(canvas):
+    """Run the startup path of the game up to the first refresh."""
+
+    main.show_first_frame(canvas)
+    return time.perf_counter()
+
+
+if __name__ == '__main__':
+    rendered = curses.wrapper(first_frame)
+    elapsed = rendered - START
+    verdict = 'OK' if elapsed < STARTUP_BUDGET else 'SLOW'
+    print('Imports: {:.1f} ms'.format((IMPORTED - START) * 1000))
+    print('Terminal setup and intro: {:.1f} ms'.format((rendered - IMPORTED) * 1000))
+    print('Time to first frame: {:.1f} ms (budget {:.0f} ms) {}'.format(
+        elapsed * 1000, STARTUP_BUDGET * 1000, verdict))
@@ -6,11 +6,17 @@ RIGHT_KEY_CODE = 261
 UP_KEY_CODE = 259
 DOWN_KEY_CODE = 258
 
+colors = None
+
 def get_colors():
+    """Init color pairs once and return them by name. Must be called after
+    curses.wrapper has initialized the terminal."""
+
     global colors
 
-    curses.initscr()
-    curses.start_color()
+    if colors is not None:
+        return colors
+
     curses.init_pair(1, curses.COLOR_WHITE, curses.COLOR_BLACK)
     curses.init_pair(2, curses.COLOR_YELLOW, curses.COLOR_BLACK)
     curses.init_pair(3, curses.COLOR_RED, curses.COLOR_BLACK)
@@ -1,3 +1,7 @@
+import json
+import sys
+
+
 PHRASES = {
     1957: "First Sputnik",
     1958: "First solar powered satellite",
@@ -20,18 +24,113 @@ PHRASES = {
     2020: "You got the plasma gun! Use the SPACE key!",
 }
 
-def get_garbage_delay_tics(year):
-    if year < 1961:
-        return None
-    elif year < 1969:
-        return 25
-    elif year < 1981:
-        return 20
-    elif year < 1995:
-        return 15
-    elif year < 2010:
-        return 10
-    elif year < 2020:
-        return 6
-    else:
-        return 2
+# Garbage spawn rates: (since year, delay in tics between spawns, pieces per spawn).
+# Delay None means no garbage since that year.
+GARBAGE_SPAWN_RATES = [
+    (1961, 26, 1),
+    (1969, 21, 1),
+    (1981, 16, 1),
+    (1995, 11, 1),
+    (2010, 7, 1),
+    (2020, 3, 1),
+]
+
+
+def _is_positive_int(value):
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 1
+
+
+def _parse_spawn_rate(rate):
+    """Convert a garbage entry of scenario file to (year, delay, count) tuple.
+    Raise ValueError if the entry is malformed."""
+
+    try:
+        since, delay, count = rate['year'], rate['delay'], rate.get('count', 1)
+    except (KeyError, TypeError, AttributeError):
+        raise ValueError('Bad garbage rate {!r}: "year" and "delay" are required'.format(rate))
+
+    if not isinstance(since, int) or isinstance(since, bool):
+        raise ValueError('Bad garbage rate {!r}: year should be an integer'.format(rate))
+    if delay is not None and not _is_positive_int(delay):
+        raise ValueError('Bad garbage rate {!r}: delay should be a positive integer or null'.format(rate))
+    if not _is_positive_int(count):
+        raise ValueError('Bad garbage rate {!r}: count should be a positive integer'.format(rate))
+
+    return since, delay, count
+
+
+def _parse_phrases(phrases):
+    """Convert phrases section of scenario file to {year: text} dict.
+    Raise ValueError if the section is malformed."""
+
+    if not isinstance(phrases, dict):
+        raise ValueError('Bad phrases {!r}: should be an object'.format(phrases))
+
+    parsed_phrases = {}
+    for year, text in phrases.items():
+        try:
+            parsed_year = int(year)
+        except ValueError:
+            raise ValueError('Bad phrase {!r}: year should be an integer'.format(year))
+        if not isinstance(text, str):
+            raise ValueError('Bad phrase {!r}: text should be a string'.format(text))
+        parsed_phrases[parsed_year] = text
+    return parsed_phrases
+
+
+def load_scenario(path):
+    """Load scenario from JSON file. Returns pair (phrases, spawn rates).
+
+    File format:
+        {
+          "phrases": {"1957": "First Sputnik", ...},
+          "garbage": [{"year": 1961, "delay": 26, "count": 1}, ...]
+        }
+    Missing sections fall back to the default scenario."""
+
+    with open(path) as file:
+        scenario = json.load(file)
+
+    if not isinstance(scenario, dict):
+        raise ValueError('Bad scenario {!r}: should be an object'.format(scenario))
+
+    phrases = PHRASES
+    if 'phrases' in scenario:
+        phrases = _parse_phrases(scenario['phrases'])
+
+    spawn_rates = GARBAGE_SPAWN_RATES
+    if 'garbage' in scenario:
+        if not isinstance(scenario['garbage'], list):
+            raise ValueError('Bad garbage rates {!r}: should be a list'.format(scenario['garbage']))
+        spawn_rates = [_parse_spawn_rate(rate) for rate in scenario['garbage']]
+
+    return phrases, spawn_rates
+
+
+def compile_timeline(phrases, spawn_rates, year_start, year_end, tics_per_year):
+    """Compile scenario into list of (tick, event, value) sorted by tick.
+
+    Events are 'year' with the year number, 'phrase' with the text and
+    'garbage' with pair (delay, count). Events of the same tick keep this
+    order, so the latest spawn rate wins when several start before year_start."""
+
+    timeline = []
+    for since, delay, count in sorted(spawn_rates, key=lambda rate: rate[0]):
+        if since > year_end:
+            break
+        tick = max(since - year_start, 0) * tics_per_year
+        timeline.append((tick, 'garbage', (delay, count)))
+
+    for year in range(year_start, year_end + 1):
+        tick = (year - year_start) * tics_per_year
+        timeline.append((tick, 'year', year))
+        if year in phrases:
+            timeline.append((tick, 'phrase', phrases[year]))
+
+    return sorted(timeline, key=lambda event: event[0])
+
+
+
+if __name__ == '__main__':
+    for path in sys.argv[1:]:
+        load_scenario(path)
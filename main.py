@@ -9,7 +9,7 @@ from curses_tools import draw_frame, get_frame, get_frame_size, read_controls, g
 from physics import update_speed
 from obstacles import Obstacle, show_obstacles
 from explosion import explode
-from game_scenario import PHRASES, get_garbage_delay_tics
+from game_scenario import PHRASES, GARBAGE_SPAWN_RATES, compile_timeline, load_scenario
 
 
 TIC_TIMEOUT = 0.1
@@ -38,7 +38,19 @@ GAMEOVER_FILE = 'frames/gameover.txt'
 
 coroutines = []
 score = 0
-colors = get_colors()
+colors = None
+
+def init_terminal(canvas):
+    """Set up cursor, input mode and color pairs. Runs inside curses.wrapper,
+    so importing this module doesn't touch the terminal. Color pairs are
+    created once, cursor and input mode are set for every canvas."""
+
+    global colors
+
+    curses.curs_set(False)
+    canvas.nodelay(True)
+    colors = get_colors()
+
 
 def intro(canvas):
     intro_frame = get_frame(INTRO_FILE)
@@ -50,21 +62,29 @@ def intro(canvas):
 
     draw_frame(canvas, row_intro, column_intro, intro_frame)
 
-def main(canvas):
+
+def show_first_frame(canvas):
+    """Prepare terminal and show intro as the first frame before any heavy
+    preparations."""
+
+    init_terminal(canvas)
+    intro(canvas)
+    canvas.refresh()
+
+
+def main(canvas, phrases=PHRASES, spawn_rates=GARBAGE_SPAWN_RATES):
     """Make some preparations, create coroutines and run event loop."""
 
-    global coroutines, obstacles, obstacles_in_last_collisions, year
+    global coroutines, obstacles, obstacles_in_last_collisions, year, phrase, win_info
 
     obstacles = []
     obstacles_in_last_collisions = set()
+    phrase = ''
 
-    curses.curs_set(False)
-    canvas.nodelay(True)
+    show_first_frame(canvas)
 
     row_max, column_max = canvas.getmaxyx()
 
-    intro(canvas)
-
     # Create stars coordinates list and remove duplicates.
     coordinates = set([
         (random.randint(1, row_max-2), random.randint(1, column_max-2))
@@ -82,54 +102,56 @@ def main(canvas):
         )
         for row, column in coordinates
     ]
-    win_info = canvas.derwin(2, column_max-1, 1, 1)
-    coroutines.append(count_years())
-    coroutines.append(show_win_info(canvas, win_info))
+    # Info window is a separate window laid over the canvas, so stars and
+    # debris don't overwrite it and its text is redrawn only on changes.
+    win_info = curses.newwin(2, column_max-1, 1, 1)
+
+    timeline = compile_timeline(
+        phrases,
+        spawn_rates,
+        YEAR_START,
+        YEAR_PLASMA_GUN_INVENTED + 1,
+        YEARS_COUNT_SPEED
+    )
+    coroutines.append(run_timeline(canvas, timeline))
 
     coroutines.append(animate_spaceship_flame())
     coroutines.append(run_spaceship(canvas, int(row_max/1.5), column_max/2))
 
-    coroutines.append(fill_orbit_with_garbage(canvas))
-
     # Run all coroutines in endless loop with interval TIC_TIMEOUT.
     while True:
         for coroutine in coroutines:
             try:
                 coroutine.send(None)
-                canvas.refresh()
             except StopIteration:
                 coroutines.remove(coroutine)
+        # Put info window over the canvas. Canvas is also refreshed by getch
+        # in read_controls, so the window is touched to be copied every tick.
+        canvas.noutrefresh()
+        win_info.touchwin()
+        win_info.noutrefresh()
+        curses.doupdate()
         time.sleep(TIC_TIMEOUT)
 
 
-async def show_win_info(canvas, win_info):
+def draw_win_info():
     """Show year and space epoch events on the left top corner. After 2020,
     when plasma gun will be invented, also show count of terminated pieces."""
 
-    global year, score, colors
+    global win_info, year, phrase, score, colors
 
-    while True:
-        if year in PHRASES:
-            phrase = PHRASES[year]
-        win_info.clrtoeol()
-        win_info.addstr(0, 0, '{}: {}'.format(year, phrase), colors['green'])
-        if year > YEAR_PLASMA_GUN_INVENTED:
-            win_info.addstr(1, 0, '{} garbage objects terminated'.format(score), colors['green'])
-        win_info.noutrefresh()
-        await asyncio.sleep(0)
+    win_info.erase()
+    win_info.addstr(0, 0, '{}: {}'.format(year, phrase), colors['green'])
+    if year > YEAR_PLASMA_GUN_INVENTED:
+        win_info.addstr(1, 0, '{} garbage objects terminated'.format(score), colors['green'])
 
 
-async def count_years():
-    global year
-    year = YEAR_START
-    while year <= YEAR_PLASMA_GUN_INVENTED:
-        await sleep(YEARS_COUNT_SPEED)
-        year += 1
+async def run_timeline(canvas, timeline):
+    """Fire scenario events when their tick comes: change year and phrase,
+    switch garbage spawn rate and spawn garbage. Sleep until the nearest
+    event instead of checking the scenario every tick."""
 
-
-async def fill_orbit_with_garbage(canvas):
-    """Control space debris."""
-    global coroutines, obstacles, year
+    global year, phrase
 
     garbage_frames = []
 
@@ -137,20 +159,61 @@ async def fill_orbit_with_garbage(canvas):
         with open(os.path.join(GARBAGE_FRAMES_DIR, filename), "r") as garbage_file:
             garbage_frames.append(garbage_file.read())
 
-    rows_number, columns_number = canvas.getmaxyx()
+    tick = 0
+    event_index = 0
+    spawn_delay = spawn_count = next_spawn_tick = None
 
     while True:
-        # Create debris coroutines with random garbage type, random column and
-        # delay depends on current year. Also create obstacles bounds.
-        if get_garbage_delay_tics(year) is not None:
-            column = random.randint(0, columns_number)
-            garbage_frame = random.choice(garbage_frames)
-            garbage_speed = random.randint(2, 10) * GARBAGE_SPEED
-            coroutines.append(fly_garbage(canvas, column, garbage_frame, garbage_speed))
-            if SHOW_OBSTACLES_BORDERS:
-                coroutines.append(show_obstacles(canvas, obstacles))
-            await sleep(get_garbage_delay_tics(year))
-        await asyncio.sleep(0)
+        win_info_changed = False
+        while event_index < len(timeline) and timeline[event_index][0] <= tick:
+            _, event, value = timeline[event_index]
+            event_index += 1
+            if event == 'year':
+                year = value
+                win_info_changed = True
+            elif event == 'phrase':
+                phrase = value
+                win_info_changed = True
+            elif event == 'garbage':
+                spawn_delay, spawn_count = value
+                if spawn_delay is None:
+                    next_spawn_tick = None
+                elif next_spawn_tick is None:
+                    next_spawn_tick = tick
+
+        if win_info_changed:
+            draw_win_info()
+
+        if next_spawn_tick == tick:
+            for _ in range(spawn_count):
+                fill_orbit_with_garbage(canvas, garbage_frames)
+            next_spawn_tick = tick + spawn_delay
+
+        due_ticks = [next_spawn_tick] if next_spawn_tick is not None else []
+        if event_index < len(timeline):
+            due_ticks.append(timeline[event_index][0])
+        if not due_ticks:
+            return
+
+        next_tick = min(due_ticks)
+        await sleep(next_tick - tick)
+        tick = next_tick
+
+
+def fill_orbit_with_garbage(canvas, garbage_frames):
+    """Create debris coroutine with random garbage type, random column
+    and speed. Also create obstacles bounds."""
+
+    global coroutines, obstacles
+
+    rows_number, columns_number = canvas.getmaxyx()
+
+    column = random.randint(0, columns_number)
+    garbage_frame = random.choice(garbage_frames)
+    garbage_speed = random.randint(2, 10) * GARBAGE_SPEED
+    coroutines.append(fly_garbage(canvas, column, garbage_frame, garbage_speed))
+    if SHOW_OBSTACLES_BORDERS:
+        coroutines.append(show_obstacles(canvas, obstacles))
 
 
 async def fly_garbage(canvas, column, garbage_frame, speed=0.5):
@@ -185,6 +248,7 @@ async def fly_garbage(canvas, column, garbage_frame, speed=0.5):
                 obstacles.remove(obstacle)
                 await explode(canvas, row + obstacle_height / 2, column + obstacle_width / 2)
                 score += 1
+                draw_win_info()
                 obstacles_in_last_collisions.remove(obstacle)
                 break
     finally:
@@ -341,7 +405,7 @@ async def show_gameover(canvas):
 
 
 if __name__ == '__main__':
-    curses.update_lines_cols()
-    curses.initscr()
-    curses.start_color()
-    curses.wrapper(main)
+    if len(sys.argv) > 1:
+        curses.wrapper(main, *load_scenario(sys.argv[1]))
+    else:
+        curses.wrapper(main)
@@ -0,0 +1,88 @@
+import json
+import os
+
+import pytest
+
+from game_scenario import PHRASES, GARBAGE_SPAWN_RATES, compile_timeline, load_scenario
+
+
+@pytest.fixture
+def scenario_file(tmp_path):
+    path = tmp_path / 'scenario.json'
+
+    def write(scenario):
+        path.write_text(json.dumps(scenario))
+        return str(path)
+
+    return write
+
+
+def test_timeline_is_sorted_by_tick():
+    timeline = compile_timeline(PHRASES, GARBAGE_SPAWN_RATES, 1957, 2021, 20)
+    ticks = [tick for tick, event, value in timeline]
+    assert ticks == sorted(ticks)
+    assert timeline[0] == (0, 'year', 1957)
+    assert (0, 'phrase', 'First Sputnik') in timeline
+    assert (80, 'garbage', (26, 1)) in timeline
+
+
+def test_last_rate_before_year_start_wins():
+    timeline = compile_timeline({}, [(1999, 3, 2), (1990, 5, 1)], 2000, 2003, 10)
+    garbage = [(tick, value) for tick, event, value in timeline if event == 'garbage']
+    assert garbage == [(0, (5, 1)), (0, (3, 2))]
+
+
+def test_null_delay_stops_spawns():
+    timeline = compile_timeline({}, [(2000, 3, 1), (2002, None, 1)], 2000, 2003, 10)
+    garbage = [(tick, value) for tick, event, value in timeline if event == 'garbage']
+    assert garbage[-1] == (20, (None, 1))
+
+
+def test_phrases_before_year_start_are_skipped():
+    timeline = compile_timeline({1950: 'Too early', 2001: 'Odyssey'}, [], 2000, 2003, 10)
+    phrases = [(tick, value) for tick, event, value in timeline if event == 'phrase']
+    assert phrases == [(10, 'Odyssey')]
+
+
+def test_missing_sections_fall_back_to_defaults(scenario_file):
+    phrases, spawn_rates = load_scenario(scenario_file({'garbage': [{'year': 1957, 'delay': 1, 'count': 10}]}))
+    assert phrases is PHRASES
+    assert spawn_rates == [(1957, 1, 10)]
+
+    phrases, spawn_rates = load_scenario(scenario_file({'phrases': {'1957': 'Start'}}))
+    assert phrases == {1957: 'Start'}
+    assert spawn_rates is GARBAGE_SPAWN_RATES
+
+
+def test_null_delay_is_loaded(scenario_file):
+    phrases, spawn_rates = load_scenario(scenario_file({'garbage': [{'year': 1957, 'delay': None}]}))
+    assert spawn_rates == [(1957, None, 1)]
+
+
+@pytest.mark.parametrize('scenario', [
+    [1, 2],
+    'scenario',
+    {'phrases': ['x']},
+    {'phrases': {'1990': 5}},
+    {'phrases': {'year': 'Text'}},
+    {'garbage': None},
+    {'garbage': {'year': 1957, 'delay': 2}},
+    {'garbage': [{'year': 1957, 'delay': 2.5}]},
+    {'garbage': [{'year': 1957, 'delay': '2'}]},
+    {'garbage': [{'year': 1957, 'delay': 0}]},
+    {'garbage': [{'year': 1957, 'delay': True}]},
+    {'garbage': [{'year': 1957, 'delay': 2, 'count': 1.5}]},
+    {'garbage': [{'year': 1957, 'delay': 2, 'count': 0}]},
+    {'garbage': [{'year': '1957', 'delay': 2}]},
+    {'garbage': [{'year': 1957}]},
+    {'garbage': [{'delay': 2}]},
+    {'garbage': [[1957, 2]]},
+])
+def test_bad_scenario_is_rejected(scenario_file, scenario):
+    with pytest.raises(ValueError):
+        load_scenario(scenario_file(scenario))
+
+
+def test_stress_scenario_loads():
+    phrases, spawn_rates = load_scenario(os.path.join(os.path.dirname(__file__), 'scenarios', 'stress.json'))
+    assert all(delay == 1 for since, delay, count in spawn_rates[1:])